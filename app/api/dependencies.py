@@ -2,22 +2,21 @@
 """
 FastAPI dependency injection providers.
 """
-from app.services.cnc_service import CNCService
+from fastapi import Request
 
-# Singleton service instance
-_cnc_service: CNCService | None = None
+from app.services.cnc_service import CNCService
 
 
-def get_cnc_service() -> CNCService:
+async def get_cnc_service(request: Request) -> CNCService:
     """
-    Dependency provider for CNC service (singleton pattern).
+    Dependency provider for CNC service (singleton created at startup).
+    
+    Declared ``async`` so FastAPI awaits it on the event loop instead of
+    dispatching it to the threadpool on every request.
     
+    :param request: Incoming request
+    :type request: Request
     :return: CNC service instance
     :rtype: CNCService
     """
-    global _cnc_service
-    
-    if _cnc_service is None:
-        _cnc_service = CNCService()
-    
-    return _cnc_service
+    return request.app.state.cnc_service
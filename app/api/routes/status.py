@@ -2,62 +2,89 @@
 """
 API routes for machine status queries.
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
 from app.models.responses import PositionResponse, MachineStatusResponse, ErrorResponse
 from app.services.cnc_service import CNCService
 from app.api.dependencies import get_cnc_service
-from app.core.exceptions import CNCException
 
 router = APIRouter(prefix="/status", tags=["Status"])
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an ``If-None-Match`` header against the current entity tag.
+    
+    Uses the weak comparison RFC 9110 requires for ``If-None-Match``: the
+    header may list several tags, carry ``W/`` prefixes, or be ``*``.
+    
+    :param if_none_match: Raw ``If-None-Match`` header value, if sent
+    :type if_none_match: str | None
+    :param etag: Current entity tag, including quotes
+    :type etag: str
+    :return: True if the client's copy is current
+    :rtype: bool
+    """
+    if not if_none_match:
+        return False
+    
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 @router.get(
     "/position",
-    response_model=PositionResponse,
-    responses={500: {"model": ErrorResponse}}
+    response_model=None,
+    responses={200: {"model": PositionResponse}, 500: {"model": ErrorResponse}}
 )
 async def get_position(
     cnc_service: CNCService = Depends(get_cnc_service)
-) -> PositionResponse:
+) -> ORJSONResponse:
     """
     Get current machine position for all axes.
     
     :param cnc_service: CNC service dependency
     :type cnc_service: CNCService
-    :return: Current position
-    :rtype: PositionResponse
-    :raises HTTPException: If status query fails
+    :return: Current position (PositionResponse schema)
+    :rtype: ORJSONResponse
+    :raises CNCException: If status query fails
     """
-    try:
-        position = cnc_service.get_position()
-        return PositionResponse(**position)
-    except CNCException as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+    position = await cnc_service.get_position_async()
+    return ORJSONResponse(content=position)
 
 
 @router.get(
     "/",
-    response_model=MachineStatusResponse,
-    responses={500: {"model": ErrorResponse}}
+    response_model=None,
+    responses={
+        200: {"model": MachineStatusResponse},
+        304: {"description": "Status unchanged since the ETag in If-None-Match"},
+        500: {"model": ErrorResponse}
+    }
 )
 async def get_machine_status(
+    request: Request,
     cnc_service: CNCService = Depends(get_cnc_service)
-) -> MachineStatusResponse:
+) -> Response:
     """
     Get comprehensive machine status including position, homing, and E-stop state.
     
+    Responses carry an ``ETag``; pollers sending it back in ``If-None-Match``
+    get ``304 Not Modified`` while the status is unchanged.
+    
+    :param request: Incoming request
+    :type request: Request
     :param cnc_service: CNC service dependency
     :type cnc_service: CNCService
-    :return: Complete machine status
-    :rtype: MachineStatusResponse
-    :raises HTTPException: If status query fails
+    :return: Complete machine status (MachineStatusResponse schema)
+    :rtype: Response
+    :raises CNCException: If status query fails
     """
-    try:
-        status = cnc_service.get_status()
-        return MachineStatusResponse(**status)
-    except CNCException as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+    status, etag = await cnc_service.get_status_with_etag_async()
+    
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return ORJSONResponse(content=status, headers={"ETag": etag})
@@ -2,20 +2,19 @@
 """
 API routes for system control (homing, E-stop, etc.).
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from app.models.requests import HomeRequest, EmergencyStopRequest
 from app.models.responses import HomeResponse, EmergencyStopResponse, ErrorResponse
 from app.services.cnc_service import CNCService
 from app.api.dependencies import get_cnc_service
-from app.core.exceptions import CNCException
 
 router = APIRouter(prefix="/system", tags=["System Control"])
 
 
 @router.post(
     "/home",
-    response_model=HomeResponse,
-    responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}}
+    response_model=None,
+    responses={200: {"model": HomeResponse}, 400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}}
 )
 async def home_machine(
     request: HomeRequest,
@@ -30,21 +29,16 @@ async def home_machine(
     :type cnc_service: CNCService
     :return: Homing operation result
     :rtype: HomeResponse
-    :raises HTTPException: If homing fails
+    :raises CNCException: If homing fails
     """
-    try:
-        result = cnc_service.home_machine(wait=request.wait)
-        return HomeResponse(**result)
-    except CNCException as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+    result = await cnc_service.home_machine_async(wait=request.wait)
+    return HomeResponse.model_construct(**result)
 
 
 @router.post(
     "/estop",
-    response_model=EmergencyStopResponse,
-    responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}}
+    response_model=None,
+    responses={200: {"model": EmergencyStopResponse}, 400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}}
 )
 async def emergency_stop(
     request: EmergencyStopRequest,
@@ -59,16 +53,11 @@ async def emergency_stop(
     :type cnc_service: CNCService
     :return: E-stop operation result
     :rtype: EmergencyStopResponse
-    :raises HTTPException: If E-stop operation fails
+    :raises CNCException: If E-stop operation fails
     """
-    try:
-        if request.reset:
-            result = cnc_service.reset_emergency_stop()
-        else:
-            result = cnc_service.trigger_emergency_stop()
-        
-        return EmergencyStopResponse(**result)
-    except CNCException as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+    if request.reset:
+        result = await cnc_service.reset_emergency_stop_async()
+    else:
+        result = await cnc_service.trigger_emergency_stop_async()
+    
+    return EmergencyStopResponse.model_construct(**result)
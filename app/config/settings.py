@@ -2,6 +2,8 @@
 """
 Application settings and configuration.
 """
+from functools import cached_property, lru_cache
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
 
@@ -24,6 +26,10 @@ class Settings(BaseSettings):
     api_port: int = 8000
     api_title: str = "CNC Control API"
     api_version: str = "1.0.0"
+    # Browser origins allowed to call the API cross-origin; none by default.
+    # The str member lets a comma-separated env value reach the validator
+    # instead of failing JSON decoding.
+    cors_origins: str | list[str] = []
     
     # Logging
     log_level: str = "INFO"
@@ -32,12 +38,36 @@ class Settings(BaseSettings):
     default_feed_rate: float = 1000.0
     max_feed_rate: float = 10000.0
     poll_interval: float = 0.05
+    status_cache_ms: float = 20.0
+    status_snapshot_interval: float = 0.02
+    status_idle_timeout: float = 1.0
+    wait_spin_duration: float = 0.001
+    wait_fast_poll_duration: float = 0.1
+    wait_fast_poll_interval: float = 0.001
+    wait_timeout: float = 600.0
+    # SCHED_FIFO priority for the LinuxCNC worker thread; 0 keeps the default scheduler
+    worker_fifo_priority: int = 0
     
     # Safety
     require_homing: bool = True
     enable_soft_limits: bool = True
     
-    @property
+    @field_validator("cors_origins", mode="before")
+    @classmethod
+    def split_cors_origins(cls, value: str | list[str]) -> list[str]:
+        """
+        Accept CORS origins as a comma-separated string or a list.
+        
+        :param value: Raw setting value
+        :type value: str | list[str]
+        :return: List of origins
+        :rtype: list[str]
+        """
+        if isinstance(value, str):
+            return [origin.strip() for origin in value.split(",") if origin.strip()]
+        return value
+    
+    @cached_property
     def hal_config_path(self) -> Path:
         """
         Get absolute path to HAL configuration file.
@@ -49,5 +79,16 @@ class Settings(BaseSettings):
         return base_path / self.hal_config_file
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings (loaded once per process).
+    
+    :return: Application settings
+    :rtype: Settings
+    """
+    return Settings()
+
+
 # Create global settings instance
-settings = Settings()
+settings = get_settings()
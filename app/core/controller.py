@@ -2,22 +2,113 @@
 """
 LinuxCNC controller wrapper with modular, well-documented methods.
 """
+import asyncio
+import os
+import random
 import sys
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import product
+from types import ModuleType
 from typing import Any
 
+from app.core._hrsleep import reduce_timer_slack, sleep_until
 from app.core.exceptions import (
     MachineNotHomedException,
+    MachineNotReadyException,
     EStopActiveException,
     MotionException,
     LinuxCNCConnectionException,
 )
 
+# Serializes controller construction (sys.path edits and NML channel setup)
+_connect_lock = threading.Lock()
+
+
+@lru_cache
+def _load_linuxcnc(linuxcnc_path: str) -> ModuleType:
+    """
+    Import the LinuxCNC Python module (once per install path).
+    
+    :param linuxcnc_path: Path to LinuxCNC Python modules
+    :type linuxcnc_path: str
+    :return: The ``linuxcnc`` module
+    :rtype: ModuleType
+    :raises ImportError: If the module cannot be imported
+    """
+    if linuxcnc_path not in sys.path:
+        sys.path.append(linuxcnc_path)
+    import linuxcnc
+    return linuxcnc
+
+
+def _gcode_template(has_x: bool, has_y: bool, has_z: bool, rapid: bool, absolute: bool) -> str:
+    """
+    Build the G-code format template for one combination of move words.
+    
+    :param has_x: Include an X word
+    :param has_y: Include a Y word
+    :param has_z: Include a Z word
+    :param rapid: Use rapid motion (no F word)
+    :param absolute: Absolute positioning
+    :return: Template with ``x``, ``y``, ``z`` and ``f`` format fields
+    :rtype: str
+    """
+    words = ["G21"]  # Metric units
+    words.append("G90" if absolute else "G91")
+    words.append("G0" if rapid else "G1")
+    
+    if has_x:
+        words.append("X{x:.4f}")
+    if has_y:
+        words.append("Y{y:.4f}")
+    if has_z:
+        words.append("Z{z:.4f}")
+    
+    if not rapid:
+        words.append("F{f:.4f}")
+    
+    return " ".join(words)
+
+
+# Axes reported by the API, in ``status.position`` order
+_AXIS_KEYS = ("x", "y", "z", "a")
+
+
+# Every (has_x, has_y, has_z, rapid, absolute) combination, built at import time
+_GCODE_TEMPLATES: dict[tuple[bool, bool, bool, bool, bool], str] = {
+    key: _gcode_template(*key) for key in product((False, True), repeat=5)
+}
+
 
 class CNCController:
     """Wrapper around LinuxCNC Python API for CNC machine control."""
     
-    def __init__(self, linuxcnc_path: str = "/usr/lib/python3/dist-packages", poll_interval: float = 0.05) -> None:
+    # Status poll attempts before giving up on LinuxCNC
+    POLL_ATTEMPTS = 3
+    # Seconds a confirmed "machine on" state is trusted without re-checking
+    MACHINE_ON_TTL = 1.0
+    # Upper bound on error messages discarded per drain
+    MAX_ERROR_DRAIN = 32
+    # Seconds a state/mode NML command may take to be acknowledged
+    COMMAND_TIMEOUT = 5.0
+    # Seconds each ``wait_complete`` call blocks before re-checking the deadline
+    COMMAND_WAIT_SLICE = 0.001
+    
+    def __init__(
+        self,
+        linuxcnc_path: str = "/usr/lib/python3/dist-packages",
+        poll_interval: float = 0.05,
+        status_cache_ttl: float = 0.02,
+        wait_spin_duration: float = 0.001,
+        wait_fast_poll_duration: float = 0.1,
+        wait_fast_poll_interval: float = 0.001,
+        wait_timeout: float = 600.0,
+        executor: Executor | None = None,
+    ) -> None:
         """
         Initialize CNC controller connection.
         
@@ -25,48 +116,214 @@ class CNCController:
         :type linuxcnc_path: str
         :param poll_interval: Seconds to sleep between status polls
         :type poll_interval: float
+        :param status_cache_ttl: Seconds a status poll is reused by read-only queries
+        :type status_cache_ttl: float
+        :param wait_spin_duration: Seconds a wait loop re-polls without sleeping
+        :type wait_spin_duration: float
+        :param wait_fast_poll_duration: Seconds a wait loop polls at ``wait_fast_poll_interval``
+        :type wait_fast_poll_duration: float
+        :param wait_fast_poll_interval: Seconds to sleep between polls early in a wait
+        :type wait_fast_poll_interval: float
+        :param wait_timeout: Seconds a move or homing wait may last before giving up
+        :type wait_timeout: float
+        :param executor: Single-worker executor that runs all blocking LinuxCNC
+            calls made from coroutines (a private one is created if omitted)
+        :type executor: Executor | None
         :raises LinuxCNCConnectionException: If cannot import or connect to LinuxCNC
         """
         self.poll_interval = poll_interval
+        # LinuxCNC command/stat/error channels are not thread-safe, so every
+        # blocking call from a coroutine is serialized on one worker thread
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="linuxcnc",
+            initializer=reduce_timer_slack,
+        )
+        self.status_cache_ttl = status_cache_ttl
+        self.wait_spin_duration = wait_spin_duration
+        self.wait_fast_poll_duration = wait_fast_poll_duration
+        self.wait_fast_poll_interval = wait_fast_poll_interval
+        self.wait_timeout = wait_timeout
+        self._status_polled_at = float("-inf")
+        self._machine_on_at = float("-inf")
+        self._last_status_key: tuple | None = None
+        self._last_status: dict[str, Any] = {}
+        self.status_etag = ""
         
         try:
-            sys.path.append(linuxcnc_path)
-            import linuxcnc
-            self.linuxcnc = linuxcnc
-            
-            self.command = linuxcnc.command()
-            self.status = linuxcnc.stat()
-            self.error_channel = linuxcnc.error_channel()
+            with _connect_lock:
+                linuxcnc = _load_linuxcnc(linuxcnc_path)
+                self.linuxcnc = linuxcnc
+                
+                # State/mode constants never change; bind them once
+                self._STATE_ESTOP = int(linuxcnc.STATE_ESTOP)
+                self._STATE_ESTOP_RESET = int(linuxcnc.STATE_ESTOP_RESET)
+                self._STATE_ON = int(linuxcnc.STATE_ON)
+                self._INTERP_IDLE = int(linuxcnc.INTERP_IDLE)
+                self._MODE_MDI = int(linuxcnc.MODE_MDI)
+                self._RCS_DONE = int(linuxcnc.RCS_DONE)
+                self._RCS_ERROR = int(linuxcnc.RCS_ERROR)
+                
+                self.command = linuxcnc.command()
+                self.status = linuxcnc.stat()
+                self.error_channel = linuxcnc.error_channel()
+                # Separate channel so E-stop never queues behind the worker thread
+                self._estop_command = linuxcnc.command()
         except Exception as e:
             raise LinuxCNCConnectionException(f"Failed to connect to LinuxCNC: {str(e)}")
+        
+        # Joint configuration is fixed by the INI file, so resolve it once
+        self._poll_status()
+        self._num_joints = (
+            getattr(self.status, "joints", 0) or self.status.axis_mask.bit_count()
+        )
+        self._homed_slice = slice(0, self._num_joints)
+        self._all_homed_mask = (1 << self._num_joints) - 1
+        
+        # Async wait loops sleep on the calling (event loop) thread
+        reduce_timer_slack()
     
     # ==================== Private Helper Methods ====================
     
-    def _poll_status(self) -> None:
+    def _poll_status(self, max_age: float = 0.0) -> None:
         """
         Update status from LinuxCNC.
         
+        A failed poll is retried immediately once, then with exponential
+        backoff and jitter.
+        
+        :param max_age: Skip the poll if the last one is younger than this many seconds
+        :type max_age: float
         :raises LinuxCNCConnectionException: If status poll fails
         """
-        try:
-            self.status.poll()
-        except Exception as e:
-            raise LinuxCNCConnectionException(f"Status poll failed: {str(e)}")
+        now = time.monotonic()
+        if now - self._status_polled_at < max_age:
+            return
+        
+        for attempt in range(self.POLL_ATTEMPTS):
+            try:
+                self.status.poll()
+                break
+            except Exception as e:
+                if attempt == self.POLL_ATTEMPTS - 1:
+                    raise LinuxCNCConnectionException(f"Status poll failed: {str(e)}")
+                if attempt:
+                    backoff = self.poll_interval * (2 ** attempt) + random.uniform(0, 0.01)
+                    sleep_until(time.monotonic_ns() + int(backoff * 1e9))
+        self._status_polled_at = now
     
-    def _drain_error_messages(self) -> list[tuple[int, str]]:
+    def _peek_first_error(self) -> tuple[int, str] | None:
         """
-        Retrieve and clear all pending error messages.
+        Retrieve the oldest pending error message, if any.
         
-        :return: List of (error_kind, error_text) tuples
-        :rtype: list[tuple[int, str]]
+        :return: (error_kind, error_text) tuple, or None if no error is pending
+        :rtype: tuple[int, str] | None
         """
-        messages = []
-        while True:
-            msg = self.error_channel.poll()
-            if not msg:
+        return self.error_channel.poll() or None
+    
+    def _discard_errors(self) -> None:
+        """
+        Clear pending error messages (at most ``MAX_ERROR_DRAIN`` per call).
+        """
+        poll = self.error_channel.poll
+        for _ in range(self.MAX_ERROR_DRAIN):
+            if not poll():
                 break
-            messages.append(msg)
-        return messages
+    
+    def _interpreter_idle(self) -> bool:
+        """
+        Poll status and check whether the interpreter is idle.
+        
+        :return: True if no MDI/program is running
+        :rtype: bool
+        :raises LinuxCNCConnectionException: If status polling fails
+        """
+        self._poll_status()
+        return self.status.interp_state == self._INTERP_IDLE
+    
+    def _wait_delay(self, elapsed: float) -> float:
+        """
+        Get the sleep before the next poll of a wait loop.
+        
+        Waits start by re-polling without sleeping, then poll every
+        ``wait_fast_poll_interval`` and finally settle at ``poll_interval``,
+        so quick commands complete with no added latency while long ones
+        stay cheap.
+        
+        :param elapsed: Seconds since the wait started
+        :type elapsed: float
+        :return: Seconds to sleep (0.0 means just yield)
+        :rtype: float
+        """
+        if elapsed < self.wait_spin_duration:
+            return 0.0
+        if elapsed < self.wait_fast_poll_duration:
+            return self.wait_fast_poll_interval
+        return self.poll_interval
+    
+    def _next_wake(self, t0: int, wake: int, now: int) -> int:
+        """
+        Get the next poll deadline of a wait loop.
+        
+        Deadlines advance from the previous one rather than from ``now``, so
+        time spent polling does not add drift.
+        
+        :param t0: Monotonic time the wait started, in ns
+        :type t0: int
+        :param wake: Previous poll deadline, in ns
+        :type wake: int
+        :param now: Current monotonic time, in ns
+        :type now: int
+        :return: Next deadline in ns (``now`` means just yield)
+        :rtype: int
+        :raises MotionException: If the wait has lasted ``wait_timeout`` seconds
+        """
+        elapsed = (now - t0) / 1e9
+        if elapsed >= self.wait_timeout:
+            raise MotionException(f"Timed out after {self.wait_timeout}s waiting for LinuxCNC")
+        
+        delay = self._wait_delay(elapsed)
+        if not delay:
+            return now
+        return max(wake + int(delay * 1e9), now)
+    
+    def _wait_until(self, predicate: Callable[[], bool]) -> None:
+        """
+        Block until predicate returns True, using adaptive poll delays.
+        
+        :param predicate: Status check that polls LinuxCNC
+        :type predicate: Callable[[], bool]
+        :raises LinuxCNCConnectionException: If status polling fails
+        :raises MotionException: If predicate stays False for ``wait_timeout`` seconds
+        """
+        t0 = wake = time.monotonic_ns()
+        while not predicate():
+            now = time.monotonic_ns()
+            wake = self._next_wake(t0, wake, now)
+            if wake > now:
+                sleep_until(wake)
+            else:
+                os.sched_yield()
+    
+    async def _await_until(self, predicate: Callable[[], bool]) -> None:
+        """
+        Wait until predicate returns True without blocking the event loop.
+        
+        Follows the same poll schedule as :meth:`_wait_until`, sleeping with
+        ``asyncio.sleep``; the predicate runs on the LinuxCNC worker thread,
+        which is free for other calls between polls.
+        
+        :param predicate: Status check that polls LinuxCNC
+        :type predicate: Callable[[], bool]
+        :raises LinuxCNCConnectionException: If status polling fails
+        :raises MotionException: If predicate stays False for ``wait_timeout`` seconds
+        """
+        loop = asyncio.get_running_loop()
+        t0 = wake = time.monotonic_ns()
+        while not await loop.run_in_executor(self.executor, predicate):
+            now = time.monotonic_ns()
+            wake = self._next_wake(t0, wake, now)
+            await asyncio.sleep((wake - now) / 1e9)
     
     def _wait_for_interpreter_idle(self) -> None:
         """
@@ -74,34 +331,167 @@ class CNCController:
         
         :raises LinuxCNCConnectionException: If status polling fails
         """
-        while True:
-            self._poll_status()
-            if self.status.interp_state == self.linuxcnc.INTERP_IDLE:
-                break
-            time.sleep(self.poll_interval)
+        self._wait_until(self._interpreter_idle)
+    
+    async def _await_interpreter_idle(self) -> None:
+        """
+        Wait until interpreter finishes current MDI/program without blocking the event loop.
+        
+        :raises LinuxCNCConnectionException: If status polling fails
+        """
+        await self._await_until(self._interpreter_idle)
     
     def _ensure_machine_on(self) -> None:
         """
         Reset E-stop and turn machine on if needed.
         
+        Skipped entirely while the machine was confirmed on within the last
+        ``MACHINE_ON_TTL`` seconds. The state is re-polled after the commands,
+        so a request LinuxCNC silently refused is never cached as "on".
+        
         :raises EStopActiveException: If E-stop cannot be cleared
+        :raises MachineNotReadyException: If the machine is still not on afterwards
         """
+        if time.monotonic() - self._machine_on_at < self.MACHINE_ON_TTL:
+            return
+        
         self._poll_status()
+        task_state = self.status.task_state
         
-        if self.status.task_state == self.linuxcnc.STATE_ESTOP:
-            self.command.state(self.linuxcnc.STATE_ESTOP_RESET)
-            self.command.wait_complete()
+        if task_state != self._STATE_ON:
+            if task_state == self._STATE_ESTOP:
+                self.command.state(self._STATE_ESTOP_RESET)
+                self._wait_cmd_complete()
+                # Re-read the state the reset actually produced
+                self._poll_status()
+            
+            if self.status.task_state != self._STATE_ON:
+                self.command.state(self._STATE_ON)
+                self._wait_cmd_complete()
+                self._poll_status()
             
-        if self.status.task_state != self.linuxcnc.STATE_ON:
-            self.command.state(self.linuxcnc.STATE_ON)
-            self.command.wait_complete()
+            if self.status.task_state != self._STATE_ON:
+                raise MachineNotReadyException(
+                    f"Machine is not on (task_state={self.status.task_state})"
+                )
+        
+        self._machine_on_at = time.monotonic()
+    
+    def _wait_ack(self, command: Any, timeout: float) -> int:
+        """
+        Wait in ``COMMAND_WAIT_SLICE`` chunks for an NML command to finish.
+        
+        :param command: ``linuxcnc.command`` the command was sent on
+        :type command: Any
+        :param timeout: Seconds to wait before giving up
+        :type timeout: float
+        :return: RCS_DONE, RCS_ERROR, or -1 if still executing at the timeout
+        :rtype: int
+        """
+        deadline = time.monotonic() + timeout
+        wait_complete = command.wait_complete
+        
+        while True:
+            # -1 means the slice timed out with the command still executing
+            result = wait_complete(self.COMMAND_WAIT_SLICE)
+            if result in (self._RCS_DONE, self._RCS_ERROR) or time.monotonic() >= deadline:
+                return result
+    
+    def _wait_cmd_complete(self) -> None:
+        """
+        Wait for a state or mode command to complete.
+        
+        These finish quickly, so one that is still executing after
+        ``COMMAND_TIMEOUT`` means the task controller is stalled.
+        
+        :raises MotionException: If LinuxCNC rejects the command
+        :raises LinuxCNCConnectionException: If the command does not complete in time
+        """
+        result = self._wait_ack(self.command, self.COMMAND_TIMEOUT)
+        if result == self._RCS_ERROR:
+            self._raise_command_error()
+        if result != self._RCS_DONE:
+            raise LinuxCNCConnectionException(
+                f"LinuxCNC did not complete command within {self.COMMAND_TIMEOUT}s"
+            )
+    
+    def _wait_cmd_dispatched(self, gcode: str | None = None) -> None:
+        """
+        Wait until LinuxCNC received an MDI or homing command, not until it finishes.
+        
+        ``wait_complete`` reports -1 both before the task has picked the
+        command up and while it executes, so receipt is confirmed by the
+        status echo serial catching up with the command serial. Until then
+        the interpreter still reads idle and homed flags are stale. Completion
+        is left to the interpreter/homing waits, which release the worker
+        thread between polls and carry their own timeout.
+        
+        :param gcode: G-code command the result belongs to, if any
+        :type gcode: str | None
+        :raises MotionException: If LinuxCNC rejects the command
+        :raises LinuxCNCConnectionException: If the command is not received in time
+        """
+        serial = self.command.serial
+        deadline = time.monotonic() + self.COMMAND_TIMEOUT
+        
+        while True:
+            result = self._wait_ack(self.command, self.COMMAND_WAIT_SLICE)
+            if result == self._RCS_ERROR:
+                self._raise_command_error(gcode)
+            if result == self._RCS_DONE:
+                return
+            
+            self._poll_status()
+            if self.status.echo_serial_number >= serial:
+                return
+            if time.monotonic() >= deadline:
+                raise LinuxCNCConnectionException(
+                    f"LinuxCNC did not receive command within {self.COMMAND_TIMEOUT}s"
+                )
+    
+    def _raise_command_error(self, gcode: str | None = None) -> None:
+        """
+        Raise for a command LinuxCNC finished with RCS_ERROR.
+        
+        The error channel text is preferred when LinuxCNC reported one.
+        
+        :param gcode: G-code command the error belongs to, if any
+        :type gcode: str | None
+        :raises MotionException: Always
+        """
+        self._raise_mdi_errors(gcode)
+        self._machine_on_at = float("-inf")
+        raise MotionException("LinuxCNC rejected the command", gcode=gcode)
     
     def _switch_to_mdi_mode(self) -> None:
         """
         Switch controller to MDI (Manual Data Input) mode.
         """
-        self.command.mode(self.linuxcnc.MODE_MDI)
-        self.command.wait_complete()
+        self.command.mode(self._MODE_MDI)
+        self._wait_cmd_complete()
+    
+    def _all_joints_homed(self) -> bool:
+        """
+        Poll status and check whether all configured joints are homed.
+        
+        :return: True if every joint is homed
+        :rtype: bool
+        :raises LinuxCNCConnectionException: If status polling fails
+        """
+        self._poll_status()
+        return bool(self._num_joints) and self._homed_mask() == self._all_homed_mask
+    
+    def _homed_mask(self) -> int:
+        """
+        Pack homed flags of the configured joints into a bitmask.
+        
+        :return: Bitmask with bit ``i`` set if joint ``i`` is homed
+        :rtype: int
+        """
+        mask = 0
+        for i, h in enumerate(self.status.homed[self._homed_slice]):
+            mask |= bool(h) << i
+        return mask
     
     def _verify_machine_homed(self) -> None:
         """
@@ -109,10 +499,7 @@ class CNCController:
         
         :raises MachineNotHomedException: If any joint is not homed
         """
-        self._poll_status()
-        homed = getattr(self.status, "homed", None)
-        
-        if not isinstance(homed, (list, tuple)) or not all(homed):
+        if not self._all_joints_homed():
             raise MachineNotHomedException("All axes must be homed before motion commands")
     
     def _execute_mdi_command(self, gcode: str, wait: bool = True) -> None:
@@ -126,14 +513,26 @@ class CNCController:
         :raises MotionException: If command execution fails
         """
         self.command.mdi(gcode)
-        self.command.wait_complete()
+        self._wait_cmd_dispatched(gcode)
         
         if wait:
             self._wait_for_interpreter_idle()
         
-        errors = self._drain_error_messages()
-        if errors:
-            kind, text = errors[0]
+        self._raise_mdi_errors(gcode)
+    
+    def _raise_mdi_errors(self, gcode: str | None) -> None:
+        """
+        Raise the first pending LinuxCNC error reported for an MDI command.
+        
+        :param gcode: G-code command the errors belong to, if any
+        :type gcode: str | None
+        :raises MotionException: If LinuxCNC reported an error
+        """
+        err = self._peek_first_error()
+        self._discard_errors()
+        if err:
+            self._machine_on_at = float("-inf")
+            kind, text = err
             raise MotionException(f"G-code error [{kind}]: {text}", gcode=gcode)
     
     # ==================== Public API Methods ====================
@@ -142,10 +541,22 @@ class CNCController:
         """
         Get current machine position for all axes.
         
+        Status younger than ``status_cache_ttl`` is reused, so concurrent
+        pollers share a single LinuxCNC roundtrip.
+        
         :return: Dictionary with axis positions (x, y, z, etc.)
         :rtype: dict[str, float]
         """
-        self._poll_status()
+        self._poll_status(max_age=self.status_cache_ttl)
+        return self._position_from_status()
+    
+    def _position_from_status(self) -> dict[str, float]:
+        """
+        Build the axis position dict from the last status poll.
+        
+        :return: Dictionary with axis positions (x, y, z, a)
+        :rtype: dict[str, float]
+        """
         position = self.status.position
         
         return {
@@ -159,19 +570,39 @@ class CNCController:
         """
         Get comprehensive machine status.
         
+        Status younger than ``status_cache_ttl`` is reused, so concurrent
+        pollers share a single LinuxCNC roundtrip. When nothing changed since
+        the previous call the same (read-only) dict is returned, and
+        ``status_etag`` is left untouched.
+        
         :return: Dictionary with machine state information
         :rtype: dict[str, Any]
         """
-        self._poll_status()
+        self._poll_status(max_age=self.status_cache_ttl)
+        status = self.status
         
-        return {
-            "position": self.get_current_position(),
-            "homed": list(getattr(self.status, "homed", [])),
-            "estop_active": self.status.task_state == self.linuxcnc.STATE_ESTOP,
-            "machine_on": self.status.task_state == self.linuxcnc.STATE_ON,
-            "interp_state": self.status.interp_state,
-            "feed_rate": self.status.current_vel * 60,  # Convert to mm/min
+        key = (
+            status.task_state,
+            status.interp_state,
+            status.current_vel,
+            status.position[:len(_AXIS_KEYS)],
+            status.homed[self._homed_slice],
+        )
+        if key == self._last_status_key:
+            return self._last_status
+        
+        self._last_status = {
+            "position": self._position_from_status(),
+            "homed": list(map(bool, status.homed[self._homed_slice])),
+            "estop_active": status.task_state == self._STATE_ESTOP,
+            "machine_on": status.task_state == self._STATE_ON,
+            "interp_state": status.interp_state,
+            "feed_rate": status.current_vel * 60,  # Convert to mm/min
         }
+        self._last_status_key = key
+        # Numeric tuples hash deterministically, so the tag is stable across restarts
+        self.status_etag = f'"{hash(key) & 0xFFFFFFFFFFFFFFFF:x}"'
+        return self._last_status
     
     def home_all_axes(self, wait: bool = True) -> None:
         """
@@ -183,25 +614,39 @@ class CNCController:
         """
         self._ensure_machine_on()
         self._switch_to_mdi_mode()
-        self._poll_status()
         
-        num_joints = getattr(self.status, "joints", 0)
-        for joint_index in range(num_joints):
-            self.command.home(joint_index)
+        # -1 homes every joint in HOME_SEQUENCE order with a single NML command
+        self.command.home(-1)
+        self._wait_cmd_dispatched()
         
         if wait:
             self._wait_for_homing_complete()
     
+    async def home_all_axes_async(self, wait: bool = True) -> None:
+        """
+        Home all machine axes without blocking the event loop.
+        
+        :param wait: Whether to wait for homing to complete
+        :type wait: bool
+        :raises EStopActiveException: If E-stop is active
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, partial(self.home_all_axes, wait=False))
+        
+        if wait:
+            await self._await_homing_complete()
+    
     def _wait_for_homing_complete(self) -> None:
         """
         Wait until all joints are homed.
         """
-        while True:
-            self._poll_status()
-            homed = getattr(self.status, "homed", [])
-            if isinstance(homed, (list, tuple)) and homed and all(homed):
-                break
-            time.sleep(self.poll_interval)
+        self._wait_until(self._all_joints_homed)
+    
+    async def _await_homing_complete(self) -> None:
+        """
+        Wait until all joints are homed without blocking the event loop.
+        """
+        await self._await_until(self._all_joints_homed)
     
     def move_absolute(
         self,
@@ -277,6 +722,60 @@ class CNCController:
             wait=wait
         )
     
+    async def move_absolute_async(
+        self,
+        x: float | None = None,
+        y: float | None = None,
+        z: float | None = None,
+        feed_rate: float = 1000.0,
+        rapid: bool = False,
+        wait: bool = True,
+    ) -> str:
+        """
+        Move to absolute coordinates without blocking the event loop.
+        
+        See :meth:`move_absolute` for parameters.
+        
+        :return: Executed G-code command
+        :rtype: str
+        :raises MachineNotHomedException: If machine is not homed
+        :raises MotionException: If motion command fails
+        """
+        return await self._execute_move_async(
+            x=x, y=y, z=z,
+            feed_rate=feed_rate,
+            rapid=rapid,
+            absolute=True,
+            wait=wait
+        )
+    
+    async def move_relative_async(
+        self,
+        x: float | None = None,
+        y: float | None = None,
+        z: float | None = None,
+        feed_rate: float = 1000.0,
+        rapid: bool = False,
+        wait: bool = True,
+    ) -> str:
+        """
+        Move relative to current position without blocking the event loop.
+        
+        See :meth:`move_relative` for parameters.
+        
+        :return: Executed G-code command
+        :rtype: str
+        :raises MachineNotHomedException: If machine is not homed
+        :raises MotionException: If motion command fails
+        """
+        return await self._execute_move_async(
+            x=x, y=y, z=z,
+            feed_rate=feed_rate,
+            rapid=rapid,
+            absolute=False,
+            wait=wait
+        )
+    
     def _execute_move(
         self,
         x: float | None,
@@ -300,7 +799,7 @@ class CNCController:
         :return: Executed G-code command
         :rtype: str
         """
-        self._drain_error_messages()
+        self._discard_errors()
         self._ensure_machine_on()
         self._verify_machine_homed()
         self._switch_to_mdi_mode()
@@ -310,6 +809,51 @@ class CNCController:
         
         return gcode
     
+    async def _execute_move_async(
+        self,
+        x: float | None,
+        y: float | None,
+        z: float | None,
+        feed_rate: float,
+        rapid: bool,
+        absolute: bool,
+        wait: bool,
+    ) -> str:
+        """
+        Internal method to execute motion commands from a coroutine.
+        
+        The command is dispatched on the LinuxCNC worker thread; the wait for
+        the interpreter to go idle runs on the event loop.
+        
+        :param x: X coordinate/displacement
+        :param y: Y coordinate/displacement
+        :param z: Z coordinate/displacement
+        :param feed_rate: Feed rate in mm/min
+        :param rapid: Use rapid motion
+        :param absolute: Absolute (True) or relative (False) positioning
+        :param wait: Wait for completion
+        :return: Executed G-code command
+        :rtype: str
+        """
+        loop = asyncio.get_running_loop()
+        gcode = await loop.run_in_executor(
+            self.executor,
+            partial(
+                self._execute_move,
+                x=x, y=y, z=z,
+                feed_rate=feed_rate,
+                rapid=rapid,
+                absolute=absolute,
+                wait=False
+            )
+        )
+        
+        if wait:
+            await self._await_interpreter_idle()
+            await loop.run_in_executor(self.executor, self._raise_mdi_errors, gcode)
+        
+        return gcode
+    
     def _build_gcode_command(
         self,
         x: float | None,
@@ -331,28 +875,23 @@ class CNCController:
         :return: G-code command string
         :rtype: str
         """
-        words = ["G21"]  # Metric units
-        words.append("G90" if absolute else "G91")
-        words.append("G0" if rapid else "G1")
-        
-        if x is not None:
-            words.append(f"X{float(x):.4f}")
-        if y is not None:
-            words.append(f"Y{float(y):.4f}")
-        if z is not None:
-            words.append(f"Z{float(z):.4f}")
-        
-        if not rapid:
-            words.append(f"F{float(feed_rate):.4f}")
-        
-        return " ".join(words)
+        template = _GCODE_TEMPLATES[(x is not None, y is not None, z is not None, rapid, absolute)]
+        return template.format(x=x, y=y, z=z, f=feed_rate)
     
     def emergency_stop(self) -> None:
         """
         Activate emergency stop immediately.
+        
+        Uses a dedicated NML command channel and no other LinuxCNC object,
+        so it is safe to call from any thread while the worker thread is
+        busy with another command.
+        
+        :raises LinuxCNCConnectionException: If LinuxCNC does not acknowledge the E-stop
         """
-        self.command.state(self.linuxcnc.STATE_ESTOP)
-        self.command.wait_complete()
+        self._machine_on_at = float("-inf")
+        self._estop_command.state(self._STATE_ESTOP)
+        if self._wait_ack(self._estop_command, self.COMMAND_TIMEOUT) != self._RCS_DONE:
+            raise LinuxCNCConnectionException("LinuxCNC did not acknowledge the E-stop")
     
     def reset_emergency_stop(self) -> None:
         """
@@ -360,5 +899,6 @@ class CNCController:
         
         :raises EStopActiveException: If E-stop cannot be reset
         """
-        self.command.state(self.linuxcnc.STATE_ESTOP_RESET)
-        self.command.wait_complete()
+        self._machine_on_at = float("-inf")
+        self.command.state(self._STATE_ESTOP_RESET)
+        self._wait_cmd_complete()
@@ -47,6 +47,19 @@ class EStopActiveException(CNCException):
         super().__init__(message, error_code="ESTOP_ACTIVE")
 
 
+class MachineNotReadyException(CNCException):
+    """Raised when the machine does not reach the ON state."""
+    
+    def __init__(self, message: str = "Machine could not be switched on") -> None:
+        """
+        Initialize machine not ready exception.
+        
+        :param message: Error message
+        :type message: str
+        """
+        super().__init__(message, error_code="MACHINE_NOT_READY")
+
+
 class InvalidParameterException(CNCException):
     """Raised when invalid parameters are provided."""
     
@@ -2,10 +2,94 @@
 """
 FastAPI application entry point.
 """
-from fastapi import FastAPI
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.config.settings import settings
 from app.api.routes import motion, status, system
+from app.core.exceptions import CNCException
+from app.services.cnc_service import CNCService
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Application lifespan handler.
+    
+    Connects to LinuxCNC once per process at startup, failing fast if it
+    is unreachable, shares the service via ``app.state`` and runs the
+    background status poller while the app is up.
+    
+    :param app: FastAPI application
+    :type app: FastAPI
+    :raises LinuxCNCConnectionException: If cannot connect to LinuxCNC
+    """
+    cnc_service = CNCService()
+    cnc_service.start_status_poller()
+    app.state.cnc_service = cnc_service
+    try:
+        yield
+    finally:
+        cnc_service.close()
+
+
+class UnhandledErrorMiddleware:
+    """
+    Translate unexpected errors raised by any route into a 500 response.
+    
+    Runs inside ``CORSMiddleware`` (unlike an ``Exception`` handler, which
+    Starlette calls from the outermost middleware), so error responses still
+    carry CORS headers and browser clients can read the detail.
+    """
+    
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Wrap an ASGI application.
+        
+        :param app: Application to wrap
+        :type app: ASGIApp
+        """
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Run the wrapped application, answering unhandled errors with a 500.
+        
+        :param scope: ASGI connection scope
+        :type scope: Scope
+        :param receive: ASGI receive callable
+        :type receive: Receive
+        :param send: ASGI send callable
+        :type send: Send
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            # Headers already sent; let the server abort the connection
+            if response_started:
+                raise
+            response = ORJSONResponse(
+                status_code=500,
+                content={"detail": f"Internal error: {str(exc)}"}
+            )
+            await response(scope, receive, send)
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -13,18 +97,40 @@ app = FastAPI(
     version=settings.api_version,
     description="REST API for LinuxCNC CNC machine control with Mesa 7i92 card",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Configure CORS
+# Registered before CORS so it sits inside it and 500s keep CORS headers
+app.add_middleware(UnhandledErrorMiddleware)
+
+# Configure CORS for the origins listed in CORS_ORIGINS (none by default), without credentials
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
+    allow_origins=settings.cors_origins,
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+
+# Translate route exceptions into error responses
+@app.exception_handler(CNCException)
+async def cnc_exception_handler(request: Request, exc: CNCException) -> ORJSONResponse:
+    """
+    Translate CNC errors raised by any route into a 400 response.
+    
+    :param request: Request that raised the error
+    :type request: Request
+    :param exc: Raised CNC exception
+    :type exc: CNCException
+    :return: Error response
+    :rtype: ORJSONResponse
+    """
+    return ORJSONResponse(status_code=400, content={"detail": str(exc)})
+
+
 # Include routers
 app.include_router(motion.router)
 app.include_router(status.router)
@@ -2,13 +2,15 @@
 """
 Pydantic models for API responses.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Any
 
 
 class PositionResponse(BaseModel):
     """Response model for position queries."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+    
     x: float = Field(..., description="X-axis position in mm")
     y: float = Field(..., description="Y-axis position in mm")
     z: float = Field(..., description="Z-axis position in mm")
@@ -18,6 +20,8 @@ class PositionResponse(BaseModel):
 class MachineStatusResponse(BaseModel):
     """Response model for comprehensive machine status."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+    
     position: PositionResponse
     homed: list[bool] = Field(..., description="Homing status for each joint")
     estop_active: bool = Field(..., description="Emergency stop status")
@@ -29,6 +33,8 @@ class MachineStatusResponse(BaseModel):
 class MoveResponse(BaseModel):
     """Response model for movement commands."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+    
     success: bool = Field(..., description="Whether move was successful")
     gcode: str = Field(..., description="G-code command that was executed")
     message: str = Field(..., description="Human-readable status message")
@@ -37,6 +43,8 @@ class MoveResponse(BaseModel):
 class HomeResponse(BaseModel):
     """Response model for homing operations."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+    
     success: bool = Field(..., description="Whether homing was successful")
     message: str = Field(..., description="Status message")
 
@@ -44,6 +52,8 @@ class HomeResponse(BaseModel):
 class ErrorResponse(BaseModel):
     """Response model for errors."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+    
     error: bool = Field(True, description="Always true for error responses")
     error_code: str = Field(..., description="Machine-readable error code")
     message: str = Field(..., description="Human-readable error message")
@@ -53,6 +63,8 @@ class ErrorResponse(BaseModel):
 class EmergencyStopResponse(BaseModel):
     """Response model for emergency stop operations."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+    
     success: bool = Field(..., description="Whether operation was successful")
     estop_active: bool = Field(..., description="Current E-stop state")
     message: str = Field(..., description="Status message")
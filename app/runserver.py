@@ -0,0 +1,31 @@
+# app/runserver.py
+"""
+Uvicorn entry point tuned for low-latency machine control.
+
+Run with ``python -m app.runserver``.
+"""
+import uvicorn
+
+from app.config.settings import settings
+
+
+def main() -> None:
+    """
+    Start the API with uvloop and httptools in a single worker process.
+    
+    A single worker keeps exactly one LinuxCNC connection per machine.
+    """
+    uvicorn.run(
+        "app.main:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        loop="uvloop",
+        http="httptools",
+        workers=1,
+        access_log=False,
+        log_level=settings.log_level.lower(),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,44 @@
 """
 CNC service layer containing business logic.
 """
-from typing import Any
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+from app.core._hrsleep import reduce_timer_slack
 from app.core.controller import CNCController
 from app.config.settings import settings
 
 
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+def _init_worker_thread(fifo_priority: int) -> None:
+    """
+    Tune the LinuxCNC worker thread for low-latency polling.
+    
+    Lowers the timer slack and, when ``fifo_priority`` is set, switches the
+    thread to ``SCHED_FIFO``; the scheduler change is skipped without
+    privileges (CAP_SYS_NICE) or on platforms that lack it.
+    
+    :param fifo_priority: ``SCHED_FIFO`` priority, or 0 to keep the default scheduler
+    :type fifo_priority: int
+    """
+    reduce_timer_slack()
+    if not fifo_priority:
+        return
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(fifo_priority))
+    except (AttributeError, OSError):
+        pass
+
+
 class CNCService:
     """Service class for CNC operations with business logic."""
     
@@ -13,10 +46,130 @@ class CNCService:
         """
         Initialize CNC service with controller.
         """
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="cnc",
+            initializer=_init_worker_thread,
+            initargs=(settings.worker_fifo_priority,)
+        )
+        # E-stop runs on its own thread so it never waits behind queued calls
+        self._estop_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="cnc-estop"
+        )
         self._controller = CNCController(
             linuxcnc_path=settings.linuxcnc_path,
-            poll_interval=settings.poll_interval
+            poll_interval=settings.poll_interval,
+            status_cache_ttl=settings.status_cache_ms / 1000,
+            wait_spin_duration=settings.wait_spin_duration,
+            wait_fast_poll_duration=settings.wait_fast_poll_duration,
+            wait_fast_poll_interval=settings.wait_fast_poll_interval,
+            wait_timeout=settings.wait_timeout,
+            executor=self._executor
+        )
+        # Only one MDI/homing sequence may be active at a time
+        self._motion_lock = asyncio.Lock()
+        
+        # Latest published (timestamp, status, etag); replaced, never mutated
+        self._snapshot: tuple[float, dict[str, Any], str] | None = None
+        self._snapshot_interval = settings.status_snapshot_interval
+        self._last_read = float("-inf")
+        self._reader_wake = threading.Event()
+        self._poller_stop = threading.Event()
+        self._poller: threading.Thread | None = None
+    
+    def start_status_poller(self) -> None:
+        """
+        Start the background thread that publishes status snapshots.
+        """
+        if self._poller is not None:
+            return
+        
+        self._poller_stop.clear()
+        self._poller = threading.Thread(
+            target=self._poll_loop,
+            name="cnc-status-poller",
+            daemon=True
         )
+        self._poller.start()
+    
+    def stop_status_poller(self) -> None:
+        """
+        Stop the background status poller and wait for it to exit.
+        """
+        if self._poller is None:
+            return
+        
+        self._poller_stop.set()
+        self._reader_wake.set()
+        self._poller.join(timeout=1.0)
+        if self._poller.is_alive():
+            # Still blocked on a worker call (e.g. behind a long move); it
+            # exits once that call returns
+            logger.warning("Status poller did not stop within 1s")
+        self._poller = None
+        self._snapshot = None
+    
+    def close(self) -> None:
+        """
+        Stop the status poller and shut down the LinuxCNC worker threads.
+        
+        Waits for calls already queued on the workers to finish.
+        """
+        self.stop_status_poller()
+        self._executor.shutdown(wait=True)
+        self._estop_executor.shutdown(wait=True)
+    
+    def _poll_loop(self) -> None:
+        """
+        Publish a status snapshot every ``status_snapshot_interval`` seconds.
+        
+        Polls go through the LinuxCNC worker thread so they never race other
+        controller calls. The loop parks while no client has read status for
+        ``status_idle_timeout`` seconds and resumes on the next read.
+        """
+        while not self._poller_stop.is_set():
+            self._reader_wake.clear()
+            if time.monotonic() - self._last_read > settings.status_idle_timeout:
+                self._snapshot = None
+                self._reader_wake.wait()
+                continue
+            
+            try:
+                status, etag = self._executor.submit(self.get_status_with_etag).result()
+                self._snapshot = (time.monotonic(), status, etag)
+            except Exception:
+                # Readers fall back to direct polls and surface the error
+                self._snapshot = None
+            
+            self._poller_stop.wait(self._snapshot_interval)
+    
+    def _fresh_snapshot(self) -> tuple[float, dict[str, Any], str] | None:
+        """
+        Record a status read and return the published snapshot if still fresh.
+        
+        :return: Snapshot younger than two publish intervals, or None
+        :rtype: tuple[float, dict[str, Any], str] | None
+        """
+        self._last_read = now = time.monotonic()
+        self._reader_wake.set()
+        
+        snapshot = self._snapshot
+        if snapshot is not None and now - snapshot[0] < 2 * self._snapshot_interval:
+            return snapshot
+        return None
+    
+    async def _run_blocking(self, func: Callable[[], T]) -> T:
+        """
+        Run a blocking controller call on the LinuxCNC worker thread.
+        
+        :param func: Callable to run
+        :type func: Callable[[], T]
+        :return: Result of the call
+        :rtype: T
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func)
     
     def get_position(self) -> dict[str, float]:
         """
@@ -27,6 +180,20 @@ class CNCService:
         """
         return self._controller.get_current_position()
     
+    async def get_position_async(self) -> dict[str, float]:
+        """
+        Get current machine position without blocking the event loop.
+        
+        Served from the status poller's snapshot when it is fresh.
+        
+        :return: Current position for all axes
+        :rtype: dict[str, float]
+        """
+        snapshot = self._fresh_snapshot()
+        if snapshot is not None:
+            return snapshot[1]["position"]
+        return await self._run_blocking(self.get_position)
+    
     def get_status(self) -> dict[str, Any]:
         """
         Get comprehensive machine status.
@@ -36,6 +203,30 @@ class CNCService:
         """
         return self._controller.get_machine_status()
     
+    def get_status_with_etag(self) -> tuple[dict[str, Any], str]:
+        """
+        Get comprehensive machine status together with its entity tag.
+        
+        :return: Machine status information and ETag header value
+        :rtype: tuple[dict[str, Any], str]
+        """
+        status = self._controller.get_machine_status()
+        return status, self._controller.status_etag
+    
+    async def get_status_with_etag_async(self) -> tuple[dict[str, Any], str]:
+        """
+        Get machine status and its entity tag without blocking the event loop.
+        
+        Served from the status poller's snapshot when it is fresh.
+        
+        :return: Machine status information and ETag header value
+        :rtype: tuple[dict[str, Any], str]
+        """
+        snapshot = self._fresh_snapshot()
+        if snapshot is not None:
+            return snapshot[1], snapshot[2]
+        return await self._run_blocking(self.get_status_with_etag)
+    
     def execute_absolute_move(
         self,
         x: float | None = None,
@@ -79,6 +270,42 @@ class CNCService:
             "message": "Move executed successfully"
         }
     
+    async def execute_absolute_move_async(
+        self,
+        x: float | None = None,
+        y: float | None = None,
+        z: float | None = None,
+        feed_rate: float | None = None,
+        rapid: bool = False,
+        wait: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Execute absolute position move without blocking the event loop.
+        
+        Concurrent motion requests are queued until the previous one completes.
+        
+        See :meth:`execute_absolute_move` for parameters.
+        
+        :return: Move result with success status and G-code
+        :rtype: dict[str, Any]
+        """
+        if feed_rate is None:
+            feed_rate = settings.default_feed_rate
+        
+        async with self._motion_lock:
+            gcode = await self._controller.move_absolute_async(
+                x=x, y=y, z=z,
+                feed_rate=feed_rate,
+                rapid=rapid,
+                wait=wait
+            )
+        
+        return {
+            "success": True,
+            "gcode": gcode,
+            "message": "Move executed successfully"
+        }
+    
     def execute_relative_move(
         self,
         x: float | None = None,
@@ -122,6 +349,42 @@ class CNCService:
             "message": "Relative move executed successfully"
         }
     
+    async def execute_relative_move_async(
+        self,
+        x: float | None = None,
+        y: float | None = None,
+        z: float | None = None,
+        feed_rate: float | None = None,
+        rapid: bool = False,
+        wait: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Execute relative position move without blocking the event loop.
+        
+        Concurrent motion requests are queued until the previous one completes.
+        
+        See :meth:`execute_relative_move` for parameters.
+        
+        :return: Move result with success status and G-code
+        :rtype: dict[str, Any]
+        """
+        if feed_rate is None:
+            feed_rate = settings.default_feed_rate
+        
+        async with self._motion_lock:
+            gcode = await self._controller.move_relative_async(
+                x=x, y=y, z=z,
+                feed_rate=feed_rate,
+                rapid=rapid,
+                wait=wait
+            )
+        
+        return {
+            "success": True,
+            "gcode": gcode,
+            "message": "Relative move executed successfully"
+        }
+    
     def home_machine(self, wait: bool = True) -> dict[str, Any]:
         """
         Home all machine axes.
@@ -138,6 +401,23 @@ class CNCService:
             "message": "Machine homed successfully"
         }
     
+    async def home_machine_async(self, wait: bool = True) -> dict[str, Any]:
+        """
+        Home all machine axes without blocking the event loop.
+        
+        :param wait: Wait for homing to complete
+        :type wait: bool
+        :return: Homing result
+        :rtype: dict[str, Any]
+        """
+        async with self._motion_lock:
+            await self._controller.home_all_axes_async(wait=wait)
+        
+        return {
+            "success": True,
+            "message": "Machine homed successfully"
+        }
+    
     def trigger_emergency_stop(self) -> dict[str, Any]:
         """
         Activate emergency stop.
@@ -153,6 +433,21 @@ class CNCService:
             "message": "Emergency stop activated"
         }
     
+    async def trigger_emergency_stop_async(self) -> dict[str, Any]:
+        """
+        Activate emergency stop without blocking the event loop.
+        
+        Bypasses both the motion lock and the LinuxCNC worker queue: the
+        E-stop is sent on the controller's dedicated command channel from
+        its own thread, so it is not delayed by an in-flight move, a queued
+        call or the status poller.
+        
+        :return: E-stop activation result
+        :rtype: dict[str, Any]
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._estop_executor, self.trigger_emergency_stop)
+    
     def reset_emergency_stop(self) -> dict[str, Any]:
         """
         Reset emergency stop state.
@@ -167,3 +462,12 @@ class CNCService:
             "estop_active": False,
             "message": "Emergency stop reset"
         }
+    
+    async def reset_emergency_stop_async(self) -> dict[str, Any]:
+        """
+        Reset emergency stop state without blocking the event loop.
+        
+        :return: E-stop reset result
+        :rtype: dict[str, Any]
+        """
+        return await self._run_blocking(self.reset_emergency_stop)
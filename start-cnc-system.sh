@@ -237,6 +237,8 @@ start_fastapi() {
     nohup uvicorn "$FASTAPI_APP" \
         --host "$FASTAPI_HOST" \
         --port "$FASTAPI_PORT" \
+        --loop uvloop \
+        --http httptools \
         --log-level info \
         > "$FASTAPI_LOG" 2>&1 &
     
@@ -0,0 +1,434 @@
+# tests/test_controller.py
+"""
+Unit tests for the LinuxCNC controller wrapper.
+"""
+import asyncio
+import sys
+import threading
+import types
+
+import pytest
+
+from app.config.settings import settings
+from app.core.controller import CNCController, _load_linuxcnc
+from app.core.exceptions import (
+    LinuxCNCConnectionException,
+    MachineNotHomedException,
+    MachineNotReadyException,
+    MotionException,
+)
+
+
+class FakeStat:
+    """Stand-in for ``linuxcnc.stat`` that counts polls."""
+    
+    def __init__(self) -> None:
+        self.polls = 0
+        self.position = (1.0, 2.0, 3.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        self.homed = (1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        self.joints = 3
+        self.axis_mask = 0b111
+        self.task_state = 4
+        self.interp_state = 1
+        self.current_vel = 0.0
+        self.echo_serial_number = 0
+    
+    def poll(self) -> None:
+        self.polls += 1
+
+
+class FakeCommand:
+    """Stand-in for ``linuxcnc.command`` that records calls."""
+    
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+        self.serial = 0
+    
+    def __getattr__(self, name: str):
+        def record(*args):
+            self.calls.append((name, *args))
+            return 1
+        return record
+
+
+class FakeErrorChannel:
+    """Stand-in for ``linuxcnc.error_channel`` holding queued messages."""
+    
+    def __init__(self) -> None:
+        self.messages: list[tuple[int, str]] = []
+    
+    def poll(self):
+        return self.messages.pop(0) if self.messages else None
+
+
+@pytest.fixture
+def fake_linuxcnc(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """
+    Install a fake ``linuxcnc`` module for the controller to import.
+    
+    :return: Fake linuxcnc module
+    """
+    module = types.ModuleType("linuxcnc")
+    module.STATE_ESTOP = 1
+    module.STATE_ESTOP_RESET = 2
+    module.STATE_OFF = 3
+    module.STATE_ON = 4
+    module.INTERP_IDLE = 1
+    module.MODE_MANUAL = 1
+    module.MODE_AUTO = 2
+    module.MODE_MDI = 3
+    module.RCS_DONE = 1
+    module.RCS_ERROR = 3
+    module.stat = FakeStat
+    module.command = FakeCommand
+    module.error_channel = FakeErrorChannel
+    monkeypatch.setitem(sys.modules, "linuxcnc", module)
+    # Services built in tests must never move their worker to SCHED_FIFO
+    monkeypatch.setattr(settings, "worker_fifo_priority", 0)
+    _load_linuxcnc.cache_clear()
+    return module
+
+
+@pytest.fixture
+def controller(fake_linuxcnc: types.ModuleType) -> CNCController:
+    """
+    Create a controller connected to the fake linuxcnc module.
+    
+    :return: CNC controller
+    """
+    return CNCController(poll_interval=0.05)
+
+
+def test_status_reads_share_recent_poll(controller: CNCController) -> None:
+    """
+    Test back-to-back status reads reuse one LinuxCNC poll.
+    
+    :return: None
+    """
+    controller._poll_status()
+    polls = controller.status.polls
+    controller.get_current_position()
+    controller.get_machine_status()
+    assert controller.status.polls == polls
+
+
+def test_control_paths_always_poll(controller: CNCController) -> None:
+    """
+    Test control paths never act on cached status.
+    
+    :return: None
+    """
+    controller.get_current_position()
+    polls = controller.status.polls
+    controller._poll_status()
+    assert controller.status.polls == polls + 1
+
+
+def test_build_gcode_command(controller: CNCController) -> None:
+    """
+    Test G-code assembly for linear and rapid moves.
+    
+    :return: None
+    """
+    assert (
+        controller._build_gcode_command(10, None, -2.5, 1500.0, rapid=False, absolute=True)
+        == "G21 G90 G1 X10.0000 Z-2.5000 F1500.0000"
+    )
+    assert (
+        controller._build_gcode_command(None, 1.25, None, 1500.0, rapid=True, absolute=False)
+        == "G21 G91 G0 Y1.2500"
+    )
+
+
+def test_verify_homed_ignores_unconfigured_joints(controller: CNCController) -> None:
+    """
+    Test homing check only covers configured joints.
+    
+    :return: None
+    """
+    controller._verify_machine_homed()
+    
+    controller.status.homed = (1, 0, 1) + (0,) * 13
+    with pytest.raises(MachineNotHomedException):
+        controller._verify_machine_homed()
+
+
+def test_move_absolute_async(controller: CNCController) -> None:
+    """
+    Test async move dispatches MDI and returns the G-code.
+    
+    :return: None
+    """
+    gcode = asyncio.run(controller.move_absolute_async(x=1.0, feed_rate=500.0))
+    assert gcode == "G21 G90 G1 X1.0000 F500.0000"
+    assert ("mdi", gcode) in controller.command.calls
+
+
+def test_poll_status_retries_transient_failure(controller: CNCController) -> None:
+    """
+    Test a single failed poll is retried before raising.
+    
+    :return: None
+    """
+    failures = iter([RuntimeError("nml busy")])
+    poll = controller.status.poll
+    
+    def flaky_poll() -> None:
+        error = next(failures, None)
+        if error:
+            raise error
+        poll()
+    
+    controller.status.poll = flaky_poll
+    controller._poll_status()
+    
+    def dead_poll() -> None:
+        raise RuntimeError("down")
+    
+    controller.status.poll = dead_poll
+    controller.poll_interval = 0.0
+    with pytest.raises(LinuxCNCConnectionException):
+        controller._poll_status()
+
+
+def test_mdi_error_raises_first_and_clears_rest(controller: CNCController) -> None:
+    """
+    Test the first queued LinuxCNC error is raised and the rest discarded.
+    
+    :return: None
+    """
+    controller.error_channel.messages = [(11, "first"), (11, "second")]
+    with pytest.raises(MotionException, match="first"):
+        controller._raise_mdi_errors("G0 X1")
+    assert controller.error_channel.messages == []
+
+
+def test_home_all_axes_sends_single_command(controller: CNCController) -> None:
+    """
+    Test homing issues one home-all command instead of one per joint.
+    
+    :return: None
+    """
+    controller.home_all_axes(wait=False)
+    homes = [call for call in controller.command.calls if call[0] == "home"]
+    assert homes == [("home", -1)]
+
+
+def test_ensure_machine_on_fast_path(controller: CNCController) -> None:
+    """
+    Test a recently confirmed machine-on state skips the state sequence.
+    
+    :return: None
+    """
+    controller._ensure_machine_on()
+    polls = controller.status.polls
+    controller._ensure_machine_on()
+    assert controller.status.polls == polls
+    
+    controller.emergency_stop()
+    controller._ensure_machine_on()
+    assert controller.status.polls == polls + 1
+
+
+def test_unchanged_status_reuses_dict(controller: CNCController) -> None:
+    """
+    Test unchanged machine status returns the cached dict and ETag.
+    
+    :return: None
+    """
+    first = controller.get_machine_status()
+    etag = controller.status_etag
+    controller._status_polled_at = float("-inf")
+    assert controller.get_machine_status() is first
+    assert controller.status_etag == etag
+    
+    controller.status.current_vel = 10.0
+    controller._status_polled_at = float("-inf")
+    assert controller.get_machine_status()["feed_rate"] == 600.0
+    assert controller.status_etag != etag
+
+
+def test_wait_until_backs_off_adaptively(controller: CNCController) -> None:
+    """
+    Test wait delays escalate from spinning to the regular poll interval.
+    
+    :return: None
+    """
+    assert controller._wait_delay(0.0) == 0.0
+    assert controller._wait_delay(0.01) == controller.wait_fast_poll_interval
+    assert controller._wait_delay(1.0) == controller.poll_interval
+    
+    results = iter([False, False, True])
+    controller._wait_until(lambda: next(results))
+
+
+def test_ensure_machine_on_from_estop(controller: CNCController, fake_linuxcnc: types.ModuleType) -> None:
+    """
+    Test E-stop is reset and the machine switched on, in that order.
+    
+    :return: None
+    """
+    states = []
+    
+    def state(new_state: int) -> int:
+        states.append(new_state)
+        controller.status.task_state = new_state
+        return 1
+    
+    controller.command.state = state
+    controller.status.task_state = fake_linuxcnc.STATE_ESTOP
+    controller._ensure_machine_on()
+    assert states == [fake_linuxcnc.STATE_ESTOP_RESET, fake_linuxcnc.STATE_ON]
+
+
+def test_ensure_machine_on_refused(controller: CNCController, fake_linuxcnc: types.ModuleType) -> None:
+    """
+    Test a machine-on request LinuxCNC ignores raises and is not cached.
+    
+    :return: None
+    """
+    controller.status.task_state = fake_linuxcnc.STATE_OFF
+    with pytest.raises(MachineNotReadyException):
+        controller._ensure_machine_on()
+    assert controller._machine_on_at == float("-inf")
+
+
+def test_status_poller_snapshot_served_while_fresh(fake_linuxcnc: types.ModuleType) -> None:
+    """
+    Test async status reads use a fresh poller snapshot and fall back when stale.
+    
+    :return: None
+    """
+    from app.services.cnc_service import CNCService
+    
+    service = CNCService()
+    try:
+        snapshot = ({"position": {"x": 1.0}}, '"cafe"')
+        service._snapshot = (float("inf"), *snapshot)
+        assert asyncio.run(service.get_status_with_etag_async()) == snapshot
+        assert asyncio.run(service.get_position_async()) == {"x": 1.0}
+        
+        service._snapshot = (float("-inf"), *snapshot)
+        status, etag = asyncio.run(service.get_status_with_etag_async())
+    finally:
+        service.close()
+    assert etag == service._controller.status_etag
+    assert "position" in status
+
+
+def test_wait_cmd_complete_retries_until_done(controller: CNCController) -> None:
+    """
+    Test state/mode waits retry timed-out slices and raise on RCS_ERROR or timeout.
+    
+    :return: None
+    """
+    results = iter([-1, -1, 1])
+    controller.command.wait_complete = lambda timeout: next(results)
+    controller._wait_cmd_complete()
+    
+    controller.command.wait_complete = lambda timeout: 3
+    with pytest.raises(MotionException):
+        controller._wait_cmd_complete()
+    
+    controller.COMMAND_TIMEOUT = 0.0
+    controller.command.wait_complete = lambda timeout: -1
+    with pytest.raises(LinuxCNCConnectionException):
+        controller._wait_cmd_complete()
+
+
+def test_mdi_wait_requires_receipt_before_idle(controller: CNCController) -> None:
+    """
+    Test an MDI wait ignores the idle state LinuxCNC reports before receiving it.
+    
+    :return: None
+    """
+    # (echo_serial_number, interp_state) per poll: not yet received while
+    # idle, then received and executing, then idle again once done
+    script = [(6, 1), (6, 1), (7, 2), (7, 2), (7, 1)]
+    status = controller.status
+    seen = []
+    
+    def poll() -> None:
+        status.echo_serial_number, status.interp_state = script[min(len(seen), len(script) - 1)]
+        seen.append(status.interp_state)
+    
+    status.poll = poll
+    controller.command.serial = 7
+    controller.command.wait_complete = lambda timeout: -1
+    controller._execute_mdi_command("G0 X1")
+    
+    assert seen == [1, 1, 2, 2, 1]
+
+
+def test_mdi_rcs_error_reports_error_channel_text(controller: CNCController) -> None:
+    """
+    Test a rejected MDI raises the error channel text and drops the machine-on cache.
+    
+    :return: None
+    """
+    controller._ensure_machine_on()
+    controller.error_channel.messages = [(11, "Unknown word")]
+    controller.command.wait_complete = lambda timeout: 3
+    
+    with pytest.raises(MotionException, match="Unknown word") as exc_info:
+        controller._execute_mdi_command("G0 Q1")
+    assert exc_info.value.gcode == "G0 Q1"
+    assert controller._machine_on_at == float("-inf")
+
+
+def test_await_until_times_out(controller: CNCController) -> None:
+    """
+    Test async waits give up after ``wait_timeout`` seconds.
+    
+    :return: None
+    """
+    controller.wait_timeout = 0.01
+    with pytest.raises(MotionException):
+        asyncio.run(controller._await_until(lambda: False))
+    
+    results = iter([False, True])
+    asyncio.run(controller._await_until(lambda: next(results)))
+
+
+def test_emergency_stop_bypasses_busy_worker(fake_linuxcnc: types.ModuleType) -> None:
+    """
+    Test E-stop is sent on its own channel while the worker thread is blocked.
+    
+    :return: None
+    """
+    from app.services.cnc_service import CNCService
+    
+    service = CNCService()
+    release = threading.Event()
+    service._executor.submit(release.wait)
+    try:
+        result = asyncio.run(
+            asyncio.wait_for(service.trigger_emergency_stop_async(), timeout=1.0)
+        )
+    finally:
+        release.set()
+        service.close()
+    
+    assert result["estop_active"] is True
+    controller = service._controller
+    assert ("state", fake_linuxcnc.STATE_ESTOP) in controller._estop_command.calls
+    assert not any(call[0] == "state" for call in controller.command.calls)
+
+
+def test_service_close_stops_poller_and_workers(fake_linuxcnc: types.ModuleType) -> None:
+    """
+    Test closing the service stops the poller thread and its executors.
+    
+    :return: None
+    """
+    from app.services.cnc_service import CNCService
+    
+    service = CNCService()
+    service.start_status_poller()
+    poller = service._poller
+    asyncio.run(service.get_status_with_etag_async())
+    service.close()
+    
+    assert not poller.is_alive()
+    with pytest.raises(RuntimeError):
+        service._executor.submit(service.get_status)
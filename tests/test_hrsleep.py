@@ -0,0 +1,29 @@
+# tests/test_hrsleep.py
+"""
+Unit tests for the absolute-deadline sleep helper.
+"""
+import time
+
+from app.core._hrsleep import sleep_until
+
+
+def test_sleep_until_deadline() -> None:
+    """
+    Test sleep_until wakes no earlier than the deadline.
+    
+    :return: None
+    """
+    deadline = time.monotonic_ns() + 5_000_000
+    sleep_until(deadline)
+    assert time.monotonic_ns() >= deadline
+
+
+def test_sleep_until_past_deadline_returns() -> None:
+    """
+    Test a deadline in the past returns immediately.
+    
+    :return: None
+    """
+    start = time.monotonic_ns()
+    sleep_until(start - 1_000_000_000)
+    assert time.monotonic_ns() - start < 50_000_000
@@ -3,7 +3,10 @@
 Unit tests for motion control endpoints.
 """
 import pytest
+from fastapi.middleware.cors import CORSMiddleware
 from fastapi.testclient import TestClient
+from app.config.settings import Settings
+from app.core.exceptions import MachineNotHomedException
 from app.main import app
 
 client = TestClient(app)
@@ -72,3 +75,122 @@ def test_get_position() -> None:
     assert "x" in data
     assert "y" in data
     assert "z" in data
+
+
+def test_cnc_exception_returns_400() -> None:
+    """
+    Test CNC errors raised inside a route are mapped to HTTP 400.
+    
+    :return: None
+    """
+    class NotHomedService:
+        async def execute_absolute_move_async(self, **kwargs) -> dict:
+            raise MachineNotHomedException()
+    
+    app.state.cnc_service = NotHomedService()
+    try:
+        response = client.post("/motion/absolute", json={"x": 1.0})
+    finally:
+        del app.state.cnc_service
+    
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Machine must be homed before this operation"}
+
+
+def test_move_request_rejects_out_of_range_and_unknown_fields() -> None:
+    """
+    Test move requests enforce coordinate bounds and forbid extra fields.
+    
+    :return: None
+    """
+    app.state.cnc_service = object()
+    try:
+        out_of_range = client.post("/motion/absolute", json={"x": 20000.0})
+        unknown = client.post("/motion/absolute", json={"x": 1.0, "speed": 5})
+    finally:
+        del app.state.cnc_service
+    
+    assert out_of_range.status_code == 422
+    assert unknown.status_code == 422
+
+
+def test_get_position_returns_service_dict_directly() -> None:
+    """
+    Test the position route serializes the service dict without revalidation.
+    
+    :return: None
+    """
+    class PositionService:
+        async def get_position_async(self) -> dict:
+            return {"x": 1.5, "y": 2.0, "z": -3.25, "a": 0.0}
+    
+    app.state.cnc_service = PositionService()
+    try:
+        response = client.get("/status/position")
+    finally:
+        del app.state.cnc_service
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"x": 1.5, "y": 2.0, "z": -3.25, "a": 0.0}
+
+
+def test_unexpected_error_returns_500_with_cors_headers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test unexpected route errors become a 500 that still carries CORS headers.
+    
+    :return: None
+    """
+    class BrokenService:
+        async def get_position_async(self) -> dict:
+            raise RuntimeError("stat channel closed")
+    
+    # Rebuild the middleware stack with the test origin allowed
+    cors = next(m for m in app.user_middleware if m.cls is CORSMiddleware)
+    monkeypatch.setitem(cors.options, "allow_origins", ["http://pendant.local"])
+    monkeypatch.setattr(app, "middleware_stack", None)
+    
+    app.state.cnc_service = BrokenService()
+    try:
+        response = client.get("/status/position", headers={"Origin": "http://pendant.local"})
+    finally:
+        del app.state.cnc_service
+    
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal error: stat channel closed"}
+    assert response.headers["access-control-allow-origin"] == "http://pendant.local"
+
+
+def test_status_if_none_match_weak_and_list_forms() -> None:
+    """
+    Test /status/ answers 304 for weak, listed and wildcard If-None-Match tags.
+    
+    :return: None
+    """
+    class StatusService:
+        async def get_status_with_etag_async(self) -> tuple[dict, str]:
+            return {"machine_on": True}, '"abc"'
+    
+    app.state.cnc_service = StatusService()
+    try:
+        codes = [
+            client.get("/status/", headers={"If-None-Match": tag}).status_code
+            for tag in ('"abc"', 'W/"abc"', '"old", W/"abc"', "*", '"old"')
+        ]
+    finally:
+        del app.state.cnc_service
+    
+    assert codes == [304, 304, 304, 304, 200]
+
+
+def test_cors_origins_accept_comma_separated_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test CORS_ORIGINS parses both comma-separated and JSON list values.
+    
+    :return: None
+    """
+    monkeypatch.setenv("CORS_ORIGINS", "http://pendant.local, http://10.0.0.5:3000")
+    assert Settings(_env_file=None).cors_origins == ["http://pendant.local", "http://10.0.0.5:3000"]
+    
+    monkeypatch.setenv("CORS_ORIGINS", '["http://pendant.local"]')
+    assert Settings(_env_file=None).cors_origins == ["http://pendant.local"]